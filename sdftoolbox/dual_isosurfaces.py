@@ -5,7 +5,12 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from .dual_strategies import LinearEdgeStrategy, NaiveSurfaceNetVertexStrategy
+from . import dual_kernels
+from .dual_strategies import (
+    LinearEdgeStrategy,
+    MidpointVertexStrategy,
+    NaiveSurfaceNetVertexStrategy,
+)
 from .mesh import triangulate_quads
 
 if TYPE_CHECKING:
@@ -31,6 +36,7 @@ def dual_isosurface(
     triangulate: bool = False,
     return_debug_info: bool = False,
     vertex_relaxation_percent: float = 0.1,
+    jit: bool = False,
 ) -> Union[tuple[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray, DebugInfo]]:
     """A vectorized dual iso-surface extraction algorithm for signed distance fields.
 
@@ -40,6 +46,13 @@ def dual_isosurface(
     This method does not compute surface normals, see `surfacenets.normals`
     for details.
 
+    For linear edge intersections combined with naive or midpoint vertex
+    placement, SDF values, edge intersections and voxel space vertices are
+    processed in single precision to halve memory traffic. Iterative edge
+    strategies and dual contouring keep the precision of the sampled SDF
+    values. Returned vertices are scaled to data space using the precision of
+    the grid.
+
     Params:
         node: the root node of the SDF. If you already have discretized SDF values in
             grid like fashion, wrap them using sdfs.Discretized.
@@ -54,6 +67,12 @@ def dual_isosurface(
             more accurate shapes when the resolution of the grid is low and multiple
             vertices per cell are required.
         return_debug_info: Whether to return additional intermediate results
+        jit: When true and numba is installed, the linear edge strategy in
+            combination with naive or midpoint vertex strategy is computed by
+            fused kernels (see `dual_kernels`). The results are equivalent.
+            Note, the first call per process compiles the kernels, which takes
+            several seconds unless numba finds them in its on-disk cache. Hence,
+            this pays off only for large grids or many repeated extractions.
 
     Returns:
         verts: (N,3) array of vertices
@@ -72,10 +91,78 @@ def dual_isosurface(
     if edge_strategy is None:
         edge_strategy = LinearEdgeStrategy()
 
+    # Single precision only changes results negligibly for linear intersections
+    # and vertex averaging, but measurably for iterative root finding.
+    fusable = dual_kernels.supports(edge_strategy, vertex_strategy)
+    sdf_values = node.sample(grid.xyz)
+    if fusable:
+        sdf_values = sdf_values.astype(np.float32, copy=False)
+    use_fused = jit and not return_debug_info and dual_kernels.HAS_NUMBA and fusable
+    if use_fused:
+        grid_verts, grid_ijk, faces = dual_kernels.fused_dual_isosurface(
+            sdf_values,
+            midpoint=isinstance(vertex_strategy, MidpointVertexStrategy),
+        )
+        debug = None
+    else:
+        grid_verts, grid_ijk, faces, debug = _generic_dual_isosurface(
+            sdf_values, node, grid, edge_strategy, vertex_strategy, t0
+        )
+
+    # Clip vertices to voxel bounds allowing for a relaxation tolerance.
+    grid_verts = (
+        np.clip(
+            grid_verts - grid_ijk,
+            0.0 - vertex_relaxation_percent,
+            1.0 + vertex_relaxation_percent,
+        )
+        + grid_ijk
+    )
+
+    # Finally, we need to account for the padded voxels and scale them to
+    # data dimensions
+    verts = grid.grid_to_data(grid_verts)
+    _logger.debug(
+        f"After vertex computation; elapsed {time.perf_counter() - t0:.4f} secs"
+    )
+
+    # 4. Step - Postprocessing
+    # In case triangulation is required, we simply split each quad into two
+    # triangles. Since the vertex order in faces is ccw, that's easy too.
+    if triangulate:
+        faces = triangulate_quads(faces)
+        _logger.debug(
+            f"After triangulation; elapsed {time.perf_counter() - t0:.4f} secs"
+        )
+    _logger.info(f"Finished after {time.perf_counter() - t0:.4f} secs")
+    _logger.info(f"Found {len(verts)} vertices and {len(faces)} faces")
+
+    if return_debug_info:
+        return verts, faces, debug
+    else:
+        return verts, faces
+
+
+def _generic_dual_isosurface(
+    sdf_values: np.ndarray,
+    node: "SDF",
+    grid: "Grid",
+    edge_strategy: "DualEdgeStrategy",
+    vertex_strategy: "DualVertexStrategy",
+    t0: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, DebugInfo]:
+    """Finds quads and vertices in voxel space using the given strategies.
+
+    Returns:
+        verts: (M,3) array of unclipped vertices in voxel space
+        voxels: (M,3) array of voxel indices one for each vertex
+        faces: (A,4) index array of quads into vertices
+        debug: instance of DebugInfo
+    """
     # First, we pad the sample volume on each outer boundary single (nan) value to
     # avoid having to deal with most out-of-bounds issues.
     padded_sdf_values = np.pad(
-        node.sample(grid.xyz),
+        sdf_values,
         ((0, 1), (0, 1), (0, 1)),
         mode="constant",
         constant_values=np.nan,
@@ -98,43 +185,62 @@ def dual_isosurface(
         (grid.num_edges, 3), np.nan, dtype=padded_sdf_values.dtype
     )
 
-    # Get all possible edge source locations
+    # Get all possible edge source locations. SDF values are gathered using flat
+    # indices into the padded volume, so that each gather is a single lookup
+    # instead of three strided ones. Edge targets are then a constant per-axis
+    # stride away from their source.
     sijk = grid.get_all_source_vertices()  # (N,3)
-    si, sj, sk = sijk.T
-    sdf_src = padded_sdf_values[si, sj, sk]  # (N,)
+    flat_src = grid.get_all_source_vertices(ravel=True)  # (N,)
+    flat_sdf_values = padded_sdf_values.reshape(-1)
+    _, PJ, PK = grid.padded_shape
+    flat_strides = (PJ * PK, PK, 1)
+    sdf_src = flat_sdf_values[flat_src]  # (N,)
+    src_sign = np.sign(sdf_src)  # (N,) shared by all axes
 
     _logger.debug(f"After initialization; elapsed {time.perf_counter() - t0:.4f} secs")
 
+    # Per-axis temporaries are allocated once and filled in-place by ufuncs.
+    num_src = flat_src.shape[0]
+    dst_sign = np.empty_like(sdf_src)
+    active = np.empty(num_src, dtype=bool)
+    finite = np.empty(num_src, dtype=bool)
+
     # For each axis
     for aidx, off in enumerate(np.eye(3, dtype=np.int32)):
-        # Compute the edge target locations and fetch SDF values
-        # Treats each axes independently, 
-        tijk = sijk + off[None, :]
-        ti, tj, tk = tijk.T
-        sdf_dst = padded_sdf_values[ti, tj, tk]
+        # Fetch SDF values at the edge target locations.
+        # Treats each axes independently.
+        sdf_dst = flat_sdf_values[flat_src + flat_strides[aidx]]
 
         # By intermediate value theorem for continuous functions if the sign of src
         # and dst is different, there must be a root enclosed. We also avoid edges
         # with NaNs, that might occur at boundaries as induced by potential SDF padding.
-        src_sign = np.sign(sdf_src)
-        dst_sign = np.sign(sdf_dst)
-        active = np.logical_and(src_sign != dst_sign, np.isfinite(sdf_dst))
+        np.sign(sdf_dst, out=dst_sign)
+        np.not_equal(src_sign, dst_sign, out=active)
+        active &= np.isfinite(sdf_dst, out=finite)
+        sijk_active = sijk[active]
+        tijk_active = sijk_active + off[None, :]
+        sdf_src_active = sdf_src[active]
+        sdf_dst_active = sdf_dst[active]
 
         # Just like in MC, we compute a parametric value t for each edge that
         # tells use where the surface boundary intersects the edge.
         t = edge_strategy.find_edge_intersections(
-            sijk[active],
-            sdf_src[active],
-            tijk[active],
-            sdf_dst[active],
+            sijk_active,
+            sdf_src_active,
+            tijk_active,
+            sdf_dst_active,
             aidx,
             off,
             node,
             grid,
         )
-        # Compute the floating point grid coords of intersection
-        isect_coords = sijk[active] + off[None, :] * t[:, None]
-        need_flip = (sdf_dst[active] - sdf_src[active]) < 0.0
+        # Compute the floating point grid coords of intersection. Since edges are
+        # axis aligned, only the coordinate along the edge axis moves. Failed
+        # intersections (non-finite t) invalidate all coordinates as before.
+        isect_coords = sijk_active.astype(padded_sdf_values.dtype)
+        isect_coords[:, aidx] += t
+        isect_coords[~np.isfinite(t)] = np.nan
+        need_flip = sdf_dst_active < sdf_src_active
 
         # We store the partial axis results in the global arrays in interleaved
         # fashion. We do this, to comply with np.unravel_index/np.ravel_multi_index
@@ -159,58 +265,44 @@ def dual_isosurface(
     # The active quad indices are are ordered ccw when looking from the positive
     # active edge direction. In case the sign difference is negative between edge
     # start and end, we need to reverse the indices to maintain a correct ccw
-    # winding order.
-    active_edges_flip = edges_flip_mask[active_edges]
-    active_quads[active_edges_flip] = np.flip(active_quads[active_edges_flip], -1)
+    # winding order. Reversing is done by swapping columns in-place, which avoids
+    # a 2D fancy-index round-trip. Fancy indexing on the right-hand side returns
+    # copies, so the swaps do not alias.
+    flip = np.flatnonzero(edges_flip_mask[active_edges])
+    q = active_quads
+    q[flip, 0], q[flip, 3] = q[flip, 3], q[flip, 0]
+    q[flip, 1], q[flip, 2] = q[flip, 2], q[flip, 1]
     _logger.debug(
         f"After correcting quads; elapsed {time.perf_counter() - t0:.4f} secs"
     )
 
     # Voxel indices are not unique, since any active voxel will be part in more than one
     # quad. However, each active voxel should give rise to only one vertex. To
-    # avoid duplicate computations, we compute the set of unique active voxels. Bonus:
-    # the inverse array is already the flattened final face array.
-    active_voxels, faces = np.unique(active_quads, return_inverse=True)  # (M,)
+    # avoid duplicate computations, we compute the set of unique active voxels.
+    # Since voxel indices are bounded by the number of voxels, we do so by
+    # scattering into a voxel mask instead of sorting. Enumerating the active
+    # voxels then gives a lookup table that maps quads to the final face array.
+    flat_quads = active_quads.reshape(-1)
+    num_voxels = int(np.prod(grid.padded_shape))
+    voxel_mask = np.zeros(num_voxels, dtype=bool)
+    voxel_mask[flat_quads] = True
+    active_voxels = np.flatnonzero(voxel_mask)  # (M,)
+    voxel_ids = np.empty(num_voxels, dtype=np.int64)
+    voxel_ids[active_voxels] = np.arange(len(active_voxels))
+    faces = voxel_ids[flat_quads]
 
     # Step 3. Vertex locations
     # For each active voxel, we need to find one vertex location. The
     # method todo that depennds on `vertex_placement_mode`. No matter which method
     # is selected, we expect the returned coordinates to be in voxel space.
-    print("active voxels ",active_voxels)
     grid_verts = vertex_strategy.find_vertex_locations(
         active_voxels, edges_isect_coords, node, grid
     )
-    # Clip vertices to voxel bounds allowing for a relaxation tolerance.
     grid_ijk = grid.unravel_nd(active_voxels, grid.padded_shape)
-    grid_verts = (
-        np.clip(
-            grid_verts - grid_ijk,
-            0.0 - vertex_relaxation_percent,
-            1.0 + vertex_relaxation_percent,
-        )
-        + grid_ijk
-    )
 
-    # Finally, we need to account for the padded voxels and scale them to
-    # data dimensions
-    verts = grid.grid_to_data(grid_verts)
-    _logger.debug(
-        f"After vertex computation; elapsed {time.perf_counter() - t0:.4f} secs"
+    return (
+        grid_verts,
+        grid_ijk,
+        faces.reshape(-1, 4),
+        DebugInfo(edges_active_mask, edges_isect_coords),
     )
-
-    # 4. Step - Postprocessing
-    # In case triangulation is required, we simply split each quad into two
-    # triangles. Since the vertex order in faces is ccw, that's easy too.
-    faces = faces.reshape(-1, 4)
-    if triangulate:
-        faces = triangulate_quads(faces)
-        _logger.debug(
-            f"After triangulation; elapsed {time.perf_counter() - t0:.4f} secs"
-        )
-    _logger.info(f"Finished after {time.perf_counter() - t0:.4f} secs")
-    _logger.info(f"Found {len(verts)} vertices and {len(faces)} faces")
-
-    if return_debug_info:
-        return verts, faces, DebugInfo(edges_active_mask, edges_isect_coords)
-    else:
-        return verts, faces
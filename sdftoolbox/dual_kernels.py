@@ -0,0 +1,264 @@
+"""Fused kernels for dual iso-surface extraction.
+
+The generic algorithm in `dual_isosurfaces` is composed of exchangeable edge
+and vertex strategies and hence works in a sequence of vectorized passes over
+the sampled volume. For the most common combination of strategies (linear
+edge intersections and naive/midpoint vertex placement) the kernels in this
+module fuse these passes into a few loops over the volume.
+
+The kernels are compiled by numba when it is installed. Without numba they
+remain plain (and slow) Python and `dual_isosurface` will not select them.
+
+Kernels are compiled once per argument type, not per volume shape. Kernels
+specialized on constant shapes and strides compile for ~1.5s per shape but
+run no measurably faster, since the passes are bound by memory traffic.
+"""
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .dual_strategies import (
+    LinearEdgeStrategy,
+    MidpointVertexStrategy,
+    NaiveSurfaceNetVertexStrategy,
+)
+from .grid import Grid
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if TYPE_CHECKING:
+    from .dual_strategies import DualEdgeStrategy, DualVertexStrategy
+
+
+HAS_NUMBA = numba is not None
+
+
+def _njit(**kwargs):
+    """Compiles the decorated function with numba when available."""
+    if numba is None:
+        return lambda fn: fn
+    return numba.njit(**kwargs)
+
+
+prange = numba.prange if numba is not None else range
+
+_VOXEL_EDGE_OFFSETS = np.ascontiguousarray(Grid.VOXEL_EDGE_OFFSETS[0])  # (12,4)
+_EDGE_VOXEL_OFFSETS = np.ascontiguousarray(Grid.EDGE_VOXEL_OFFSETS)  # (3,4,3)
+
+
+def supports(
+    edge_strategy: "DualEdgeStrategy", vertex_strategy: "DualVertexStrategy"
+) -> bool:
+    """Whether the fused kernels can replace the given strategies."""
+    return type(edge_strategy) is LinearEdgeStrategy and type(vertex_strategy) in (
+        NaiveSurfaceNetVertexStrategy,
+        MidpointVertexStrategy,
+    )
+
+
+@_njit(cache=True)
+def _is_active(src, dst):
+    """Whether the surface boundary crosses the edge between src and dst.
+
+    By intermediate value theorem an edge is active when the signs of its
+    endpoints differ. Edges with non-finite target values (e.g. padding) are
+    inactive.
+    """
+    return np.sign(src) != np.sign(dst) and np.isfinite(dst)
+
+
+@_njit(cache=True)
+def _edge_intersection(src, dst):
+    """Returns the linear intersection parameter of an edge or NaN if inactive."""
+    if not _is_active(src, dst):
+        return np.nan
+    return -src / (dst - src)
+
+
+@_njit(parallel=True, cache=True, error_model="numpy")
+def _edge_kernel(sdf, edges_quad_mask):
+    """Classifies all forward edges of the volume in a single pass.
+
+    For each edge (i,j,k,a), `edges_quad_mask` receives whether the edge is
+    active and has a full neighborhood of four voxels, i.e gives rise to a
+    quad. Intersection parameters are not stored, but recomputed from the few
+    active voxels later on.
+    """
+    I, J, K = sdf.shape
+    for i in prange(I):
+        for j in range(J):
+            for k in range(K):
+                src = sdf[i, j, k]
+                # Quads require all four voxels sharing the edge to exist. Edges
+                # whose target lies in the padding area are never active.
+                edges_quad_mask[i, j, k, 0] = (
+                    i + 1 < I
+                    and 1 <= j <= J - 2
+                    and 1 <= k <= K - 2
+                    and _is_active(src, sdf[i + 1, j, k])
+                )
+                edges_quad_mask[i, j, k, 1] = (
+                    j + 1 < J
+                    and 1 <= i <= I - 2
+                    and 1 <= k <= K - 2
+                    and _is_active(src, sdf[i, j + 1, k])
+                )
+                edges_quad_mask[i, j, k, 2] = (
+                    k + 1 < K
+                    and 1 <= i <= I - 2
+                    and 1 <= j <= J - 2
+                    and _is_active(src, sdf[i, j, k + 1])
+                )
+
+
+@_njit(cache=True)
+def _voxel_kernel(quad_edges, edge_shape, voxel_mask):
+    """Marks all voxels sharing at least one of the given edges as active."""
+    _, J, K, _ = edge_shape
+    for n in range(quad_edges.shape[0]):
+        e = quad_edges[n]
+        a = e % 3
+        k = (e // 3) % K
+        j = (e // (3 * K)) % J
+        i = e // (3 * K * J)
+        for q in range(4):
+            voxel_mask[
+                i + _EDGE_VOXEL_OFFSETS[a, q, 0],
+                j + _EDGE_VOXEL_OFFSETS[a, q, 1],
+                k + _EDGE_VOXEL_OFFSETS[a, q, 2],
+            ] = True
+
+
+@_njit(cache=True)
+def _compact_kernel(voxel_mask, voxels, voxel_ids):
+    """Enumerates active voxels in flat order.
+
+    Writes the nd index of the n-th active voxel to `voxels[n]` and n to
+    `voxel_ids` at the voxel's location. Entries of inactive voxels in
+    `voxel_ids` are left untouched.
+    """
+    I, J, K = voxel_mask.shape
+    n = 0
+    for i in range(I):
+        for j in range(J):
+            for k in range(K):
+                if voxel_mask[i, j, k]:
+                    voxels[n, 0] = i
+                    voxels[n, 1] = j
+                    voxels[n, 2] = k
+                    voxel_ids[i, j, k] = n
+                    n += 1
+
+
+@_njit(parallel=True, cache=True, error_model="numpy")
+def _vertex_kernel(voxels, sdf, midpoint, verts):
+    """Computes one vertex in voxel space for each of the given voxels.
+
+    Vertices are either placed at voxel centers or at the average of all
+    edge intersection points of the voxel.
+    """
+    for n in prange(voxels.shape[0]):
+        i = voxels[n, 0]
+        j = voxels[n, 1]
+        k = voxels[n, 2]
+        if midpoint:
+            verts[n, 0] = i + 0.5
+            verts[n, 1] = j + 0.5
+            verts[n, 2] = k + 0.5
+            continue
+        x = y = z = 0.0
+        count = 0
+        for e in range(12):
+            ei = i + _VOXEL_EDGE_OFFSETS[e, 0]
+            ej = j + _VOXEL_EDGE_OFFSETS[e, 1]
+            ek = k + _VOXEL_EDGE_OFFSETS[e, 2]
+            a = _VOXEL_EDGE_OFFSETS[e, 3]
+            t = _edge_intersection(
+                sdf[ei, ej, ek],
+                sdf[ei + (a == 0), ej + (a == 1), ek + (a == 2)],
+            )
+            if np.isfinite(t):
+                x += ei + t if a == 0 else ei
+                y += ej + t if a == 1 else ej
+                z += ek + t if a == 2 else ek
+                count += 1
+        if count > 0:
+            verts[n, 0] = x / count
+            verts[n, 1] = y / count
+            verts[n, 2] = z / count
+        else:
+            verts[n, :] = np.nan
+
+
+@_njit(parallel=True, cache=True)
+def _face_kernel(quad_edges, sdf, voxel_ids, faces):
+    """Emits one quad per active edge with vertex indices in ccw order."""
+    I, J, K = sdf.shape
+    for n in prange(quad_edges.shape[0]):
+        e = quad_edges[n]
+        a = e % 3
+        k = (e // 3) % K
+        j = (e // (3 * K)) % J
+        i = e // (3 * K * J)
+        # Reverse the winding order when the SDF decreases along the edge
+        flip = sdf[i + (a == 0), j + (a == 1), k + (a == 2)] - sdf[i, j, k] < 0.0
+        for q in range(4):
+            vid = voxel_ids[
+                i + _EDGE_VOXEL_OFFSETS[a, q, 0],
+                j + _EDGE_VOXEL_OFFSETS[a, q, 1],
+                k + _EDGE_VOXEL_OFFSETS[a, q, 2],
+            ]
+            if flip:
+                faces[n, 3 - q] = vid
+            else:
+                faces[n, q] = vid
+
+
+def fused_dual_isosurface(
+    sdf_values: np.ndarray, midpoint: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extracts a quad mesh in voxel space from the given SDF volume.
+
+    Equivalent to the generic dual iso-surface extraction with linear edge
+    strategy and naive or midpoint vertex strategy. Vertices and faces are
+    emitted in the same order as the generic variant does.
+
+    Params:
+        sdf_values: (I,J,K) array of SDF values
+        midpoint: When true, places vertices at voxel centers. Otherwise
+            vertices are the average of edge intersection points.
+
+    Returns:
+        verts: (M,3) array of vertices in voxel space
+        voxels: (M,3) array of voxel indices one for each vertex
+        faces: (A,4) index array of quads into vertices
+    """
+    sdf_values = np.ascontiguousarray(sdf_values)
+    I, J, K = sdf_values.shape
+
+    # The only dense pass over all edges. Everything below works on the
+    # (comparatively few) active edges and voxels.
+    edges_quad_mask = np.empty((I, J, K, 3), dtype=bool)
+    _edge_kernel(sdf_values, edges_quad_mask)
+    quad_edges = np.flatnonzero(edges_quad_mask)
+
+    # A voxel is active when at least one of its edges gives rise to a quad.
+    # Enumerating active voxels in flat order yields the same vertex order as
+    # np.unique on padded voxel indices. Voxel ids are only ever read at
+    # active voxels, hence need no initialization.
+    voxel_shape = (max(I - 1, 0), max(J - 1, 0), max(K - 1, 0))
+    voxel_mask = np.zeros(voxel_shape, dtype=bool)
+    _voxel_kernel(quad_edges, edges_quad_mask.shape, voxel_mask)
+    voxels = np.empty((np.count_nonzero(voxel_mask), 3), dtype=np.int64)
+    voxel_ids = np.empty(voxel_shape, dtype=np.int32)
+    _compact_kernel(voxel_mask, voxels, voxel_ids)
+
+    verts = np.empty((voxels.shape[0], 3), dtype=sdf_values.dtype)
+    _vertex_kernel(voxels, sdf_values, midpoint, verts)
+
+    faces = np.empty((quad_edges.shape[0], 4), dtype=np.int64)
+    _face_kernel(quad_edges, sdf_values, voxel_ids, faces)
+    return verts, voxels, faces
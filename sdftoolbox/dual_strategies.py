@@ -69,7 +69,12 @@ class NaiveSurfaceNetVertexStrategy(DualVertexStrategy):
         del node
         active_voxel_edges = grid.find_voxel_edges(active_voxels)  # (M,12)
         e = edge_coords[active_voxel_edges]  # (M,12,3)
-        return np.nanmean(e, 1)  # (M,3)
+        # Inactive edges are NaN in all coordinates, so a single channel suffices
+        # to mask them. A plain masked sum/count is considerably faster than
+        # np.nanmean. Fancy indexing returned a copy, so we may zero it in place.
+        mask = np.isfinite(e[..., 0])  # (M,12)
+        e[~mask] = 0.0
+        return e.sum(1) / mask.sum(1, keepdims=True).astype(e.dtype)  # (M,3)
 
 class DualContouringVertexStrategy3x3(DualVertexStrategy):
     """Computes vertex locations based on dual-contouring strategy.
@@ -369,7 +374,12 @@ class LinearEdgeStrategy(DualEdgeStrategy):
 
     @staticmethod
     def compute_linear_roots(src_sdf: np.ndarray, dst_sdf: np.ndarray) -> np.ndarray:
-        return -src_sdf / (dst_sdf - src_sdf)
+        t = np.subtract(dst_sdf, src_sdf)
+        if isinstance(t, np.ndarray) and np.issubdtype(t.dtype, np.floating):
+            # Equivalent to -src_sdf / t, but reuses the buffer of t.
+            np.divide(src_sdf, t, out=t)
+            return np.negative(t, out=t)
+        return -src_sdf / t
 
 
 class NewtonEdgeStrategy(DualEdgeStrategy):
@@ -103,6 +103,19 @@ class Grid:
         )
         self.edge_shape = self.xyz.shape[:3] + (3,)
         self.num_edges = np.prod(self.edge_shape)
+        self._source_vertices = None
+
+        # Flat index offsets equivalent to VOXEL_EDGE_OFFSETS/EDGE_VOXEL_OFFSETS.
+        # These turn topology queries on flat indices into single additions.
+        _, J, K, _ = self.edge_shape
+        _, PJ, PK = self.padded_shape
+        self._voxel_edge_flat_offsets = (
+            Grid.VOXEL_EDGE_OFFSETS[0, :, :3] @ np.array([J * K * 3, K * 3, 3])
+            + Grid.VOXEL_EDGE_OFFSETS[0, :, 3]
+        )  # (12,)
+        self._edge_voxel_flat_offsets = Grid.EDGE_VOXEL_OFFSETS @ np.array(
+            [PJ * PK, PK, 1]
+        )  # (3,4)
 
     @property
     def spacing(self):
@@ -166,7 +179,7 @@ class Grid:
 
         This method is quite a bit faster than
 
-            find_edge_vertices(range(num_edges))
+            find_edge_vertices(np.arange(num_edges))
 
         because it avoids unravelling. In the current implementation
         this method is is not used in favor of `get_all_source_vertices`,
@@ -202,27 +215,38 @@ class Grid:
             tijk = self.ravel_nd(tijk, self.padded_shape)
         return sijk, tijk
 
-    def get_all_source_vertices(self):
+    def get_all_source_vertices(self, ravel: bool = False) -> np.ndarray:
         """Find all edge start voxel indices
 
         Similar to `get_all_edge_vertices` but does not compute
         target voxel indices also does not repeat (x3) the source
-        voxel indices for each possible edge direction.
+        voxel indices for each possible edge direction. Results are
+        cached with the grid, hence released along with it, and returned
+        read-only.
+
+        Params:
+            ravel: Whether to return voxels as flat indices or nd indices.
 
         Returns:
-            s: (N,3) array of source voxel indices for each possible edge
+            s: (N,) or (N,3) array of source voxel indices for each possible edge
         """
-        I, J, K = self.edge_shape[:3]
-        sijk = np.stack(
-            np.meshgrid(
-                np.arange(I, dtype=np.int32),
-                np.arange(J, dtype=np.int32),
-                np.arange(K, dtype=np.int32),
-                indexing="ij",
-            ),
-            -1,
-        ).reshape(-1, 3)
-        return sijk
+        if self._source_vertices is None:
+            I, J, K = self.edge_shape[:3]
+            sijk = np.stack(
+                np.meshgrid(
+                    np.arange(I, dtype=np.int32),
+                    np.arange(J, dtype=np.int32),
+                    np.arange(K, dtype=np.int32),
+                    indexing="ij",
+                ),
+                -1,
+            ).reshape(-1, 3)
+            flat = np.ravel_multi_index(list(sijk.T), dims=self.padded_shape)
+            sijk.flags.writeable = False
+            flat.flags.writeable = False
+            self._source_vertices = (sijk, flat)
+        sijk, flat = self._source_vertices
+        return flat if ravel else sijk
 
     def find_voxels_sharing_edge(
         self, edges: np.ndarray, ravel: bool = True
@@ -243,18 +267,23 @@ class Grid:
         voxels = edges[..., :3]
         elabels = edges[..., -1]
 
-        neighbors = (
-            np.expand_dims(voxels, -2) + Grid.EDGE_VOXEL_OFFSETS[elabels]
-        )  # (N,4,3)
-
-        edge_mask = (neighbors >= 0) & (neighbors < np.array(self.shape) - 1)
-        edge_mask = edge_mask.all(-1).all(-1)  # All edges that have 4 valid neighbors
-        neighbors[~edge_mask] = 0
+        # All edges that have 4 valid neighbors. Neighbor offsets are zero along
+        # the edge direction and in {-1,0} otherwise, so it suffices to test the
+        # smallest offset voxel against the lower and the edge voxel against the
+        # upper bound.
+        lower = voxels + Grid.EDGE_VOXEL_OFFSETS[elabels].min(-2)  # (N,3)
+        edge_mask = (lower >= 0).all(-1) & (voxels < np.array(self.shape) - 1).all(-1)
 
         if ravel:
-            neighbors = self.ravel_nd(
-                neighbors.reshape(-1, 3), self.padded_shape
-            ).reshape(-1, 4)
+            neighbors = (
+                np.ravel_multi_index(list(voxels.T), self.padded_shape)[:, None]
+                + self._edge_voxel_flat_offsets[elabels]
+            )  # (N,4)
+        else:
+            neighbors = (
+                np.expand_dims(voxels, -2) + Grid.EDGE_VOXEL_OFFSETS[elabels]
+            )  # (N,4,3)
+        neighbors[~edge_mask] = 0
         return neighbors, edge_mask
 
     def find_voxel_edges(self, voxels: np.ndarray, ravel: bool = True) -> np.ndarray:
@@ -272,13 +301,22 @@ class Grid:
             voxels = self.unravel_nd(voxels, self.padded_shape)
         N = voxels.shape[0]
 
+        if ravel:
+            # Flat edge ids are computed from constant offsets and would silently
+            # wrap for voxels in the padding area. Reject those like ravel_nd does.
+            inside = (voxels >= 0) & (voxels < np.array(self.edge_shape[:3]) - 1)
+            if not inside.all():
+                raise ValueError("invalid entry in coordinates array")
+            return (
+                np.ravel_multi_index(list(voxels.T), self.edge_shape[:3])[:, None]
+                * 3
+                + self._voxel_edge_flat_offsets
+            )  # (N,12)
+
         voxels = np.expand_dims(
             np.concatenate((voxels, np.zeros((N, 1), dtype=np.int32)), -1), -2
         )
-        edges = voxels + Grid.VOXEL_EDGE_OFFSETS
-        if ravel:
-            edges = self.ravel_nd(edges.reshape(-1, 4), self.edge_shape).reshape(-1, 12)
-        return edges
+        return voxels + Grid.VOXEL_EDGE_OFFSETS
 
     def grid_to_data(self, x: np.ndarray) -> np.ndarray:
         """Convert coordinates in grid space to data space."""
@@ -67,9 +67,12 @@ def triangulate_quads(quads: np.ndarray) -> np.ndarray:
     Returns:
         tris: (M*2,3) array of triangles
     """
+    # Both triangles share the first quad vertex. Using basic slicing instead of
+    # fancy indexing avoids creating temporary (M,3) index arrays.
     tris = np.empty((quads.shape[0], 2, 3), dtype=quads.dtype)
-    tris[:, 0, :] = quads[:, [0, 1, 2]]
-    tris[:, 1, :] = quads[:, [0, 2, 3]]
+    tris[:, :, 0] = quads[:, :1]
+    tris[:, 0, 1:] = quads[:, 1:3]
+    tris[:, 1, 1:] = quads[:, 2:4]
     return tris.reshape(-1, 3)
 
 
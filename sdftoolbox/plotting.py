@@ -1,5 +1,8 @@
 """Helper functions for plotting meshes through matplotlib."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Literal, Union
 
 import matplotlib.pyplot as plt
@@ -11,6 +14,46 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 
 
+class IndexedPoly3DCollection(Poly3DCollection):
+    """A Poly3DCollection defined by shared vertices and a face index array.
+
+    Polygons `verts[faces]` are materialized lazily on the next 3d projection
+    and only when vertices or faces have changed since. Updating vertices
+    repeatedly between draws (e.g. in animations) therefore gathers polygons
+    only once per draw.
+
+    Shading (`shade=True`) is computed from the polygons at construction, hence
+    these are gathered eagerly in that case. Like for Poly3DCollection, shading
+    is not recomputed when vertices change later on.
+    """
+
+    def __init__(self, verts: np.ndarray, faces: np.ndarray, **kwargs):
+        self._verts_arr = np.asarray(verts)
+        self._faces_arr = np.asarray(faces)
+        self._version = 0
+        if kwargs.get("shade", False):
+            super().__init__(self._verts_arr[self._faces_arr], **kwargs)
+            self._materialized_version = self._version
+        else:
+            super().__init__([], **kwargs)
+            self._materialized_version = -1
+
+    def set_indexed_verts(self, verts: np.ndarray = None, faces: np.ndarray = None):
+        """Updates vertices and/or faces. Polygons are updated on next draw."""
+        if verts is not None:
+            self._verts_arr = np.asarray(verts)
+        if faces is not None:
+            self._faces_arr = np.asarray(faces)
+        self._version += 1
+        self.stale = True
+
+    def do_3d_projection(self):
+        if self._materialized_version != self._version:
+            self.set_verts(self._verts_arr[self._faces_arr])
+            self._materialized_version = self._version
+        return super().do_3d_projection()
+
+
 def create_figure(
     proj_type: Literal["persp", "ortho"] = "persp",
     fig_aspect: float = 1,
@@ -27,15 +70,21 @@ def create_figure(
 
 
 def create_split_figure(
-    sync: bool = True, proj_type: Literal["persp", "ortho"] = "persp"
+    sync: bool = True,
+    proj_type: Literal["persp", "ortho"] = "persp",
+    sync_rate: float = 30.0,
 ) -> tuple[Figure, Axes]:
     """Returns a figure composed of two axis for side-by-side 3d plotting.
 
     Params:
-        sync: Whether or not to sync the two views once an interactive op
-            has finished. Axis sharing like for 2d plots is not implemented
-            for matplotlib 3d, so we simulate it with custom code.
+        sync: Whether or not to sync the two views during interactive ops.
+            Axis sharing like for 2d plots is not implemented for matplotlib 3d,
+            so we simulate it with custom code.
         proj_type: Projection type
+        sync_rate: Maximum number of view syncs per second while dragging.
+            Redraws are requested by matplotlib on each motion event and pick
+            up the most recent sync. The final view is always synced on
+            release. A non-positive value syncs on every motion event.
 
     Returns:
         fig: matplotlib figure
@@ -51,6 +100,8 @@ def create_split_figure(
 
     sync_pending = False
     sync_dir = [None, None]
+    min_interval = 1.0 / sync_rate if sync_rate > 0 else 0.0
+    last_sync = 0.0
 
     def sync_views(a, b):
         b.view_init(elev=a.elev, azim=a.azim)
@@ -65,6 +116,14 @@ def create_split_figure(
             sync_pending = True
             sync_dir = [ax0, ax1] if event.inaxes == ax0 else [ax1, ax0]
 
+    def on_motion(event):
+        # The dragged axis already requests a redraw, so only throttle syncs.
+        nonlocal last_sync
+        now = time.perf_counter()
+        if sync_pending and now - last_sync >= min_interval:
+            last_sync = now
+            sync_views(*sync_dir)
+
     def on_release(event):
         nonlocal sync_pending
 
@@ -75,6 +134,7 @@ def create_split_figure(
 
     if sync:
         fig.canvas.mpl_connect("button_press_event", on_press)
+        fig.canvas.mpl_connect("motion_notify_event", on_motion)
         fig.canvas.mpl_connect("button_release_event", on_release)
 
     return fig, (ax0, ax1)
@@ -90,6 +150,10 @@ def setup_axes(
 ):
     """Set axis view options.
 
+    Intended to be called once per axis while setting up a figure. To change
+    the camera of an existing figure (e.g. per animation frame) use
+    `ax.view_init` only, see `generate_rotation_gif`.
+
     Params:
         ax: matplotlib axis
         min_corner: min data corner for computing zoom values
@@ -132,6 +196,7 @@ def plot_mesh(
     faces: np.ndarray,
     face_normals: np.ndarray = None,
     vertex_normals: np.ndarray = None,
+    indexed: bool = False,
     **kwargs,
 ):
     """Add a mesh to the axis.
@@ -144,46 +209,70 @@ def plot_mesh(
             arrows will be plotted to indicate the normal per face.
         vertex_normals: (N,3) array of vertex normals (optional). When supplied,
             additional arrows will be plotted to indicate the normal per vertex.
+        indexed: When true, adds an IndexedPoly3DCollection that gathers
+            polygons lazily at draw time. Axis limits are then updated from
+            all vertices.
         kwargs: additional arguments passed to Poly3DCollection
+
+    Returns:
+        mesh: the (Indexed)Poly3DCollection added to the axis. Keep a reference
+            to it when drawing the same mesh repeatedly (e.g. in animations)
+            instead of adding it again.
     """
     # Better colors? https://matplotlib.org/stable/gallery/mplot3d/voxels_rgb.html
     # https://stackoverflow.com/questions/56864378/how-to-light-and-shade-a-poly3dcollection
     kwargs = {"linewidth": 0.2, "zorder": 1, **kwargs}
-    mesh = Poly3DCollection(verts[faces], **kwargs)
-    mesh.set_edgecolor("w")
-    ax.add_collection3d(mesh)
+    if indexed:
+        mesh = IndexedPoly3DCollection(verts, faces, **kwargs)
+        mesh.set_edgecolor("w")
+        # Polygons are not materialized yet, so scale limits from vertices.
+        # Note, autolim is not available for matplotlib < 3.9.
+        had_data = ax.has_data()
+        ax.add_collection3d(mesh)
+        ax.auto_scale_xyz(verts[:, 0], verts[:, 1], verts[:, 2], had_data=had_data)
+    else:
+        polys = verts[faces]  # (M,F,3)
+        mesh = Poly3DCollection(polys, **kwargs)
+        mesh.set_edgecolor("w")
+        ax.add_collection3d(mesh)
 
     if face_normals is not None:
-        centers = verts[faces].mean(1)
+        centers = verts[faces].mean(1) if indexed else polys.mean(1)
         plot_normals(ax, centers, face_normals, color="purple")
 
     if vertex_normals is not None:
         plot_normals(ax, verts, vertex_normals, color="lime")
 
+    return mesh
+
+
+def plot_samples(ax, xyz: np.ndarray, sdf_values: np.ndarray = None, stride: int = 1):
+    """Plots sampling points and colorizes them based on sdf classification.
 
-def plot_samples(ax, xyz: np.ndarray, sdf_values: np.ndarray = None):
-    """Plots sampling points and colorizes them based on sdf classification."""
-    colors = np.zeros_like(xyz)
+    Inside (yellow) and outside (black) points are drawn as two single-color
+    scatters, which render considerably faster than per-point colors. Use
+    `stride` to plot only every n-th sample along each grid axis for large
+    grids.
+    """
+    sl = (slice(None, None, stride),) * (xyz.ndim - 1)
+    xyz = xyz[sl]
+    inside = np.zeros(xyz.shape[:-1], dtype=bool)
     if sdf_values is not None:
-        colors[sdf_values <= 0] = (1.0, 1.0, 0.0)
-    ax.scatter(
-        xyz[..., 0], xyz[..., 1], xyz[..., 2], s=2, c=colors.reshape(-1, 3), alpha=0.5
-    )
+        inside = sdf_values[sl] <= 0
+    for mask, color in [(inside, "yellow"), (~inside, "black")]:
+        ax.scatter(xyz[mask, 0], xyz[mask, 1], xyz[mask, 2], s=2, c=color, alpha=0.5)
 
 
 def plot_normals(ax, origins: np.ndarray, dirs: np.ndarray, **kwargs):
-    """Plots normals from points and directions"""
-    kwargs = {"linewidth": 0.5, "zorder": 2, "length": 0.1, **kwargs}
+    """Plots normals from points and directions
 
-    ax.quiver(
-        origins[:, 0],
-        origins[:, 1],
-        origins[:, 2],
-        dirs[:, 0],
-        dirs[:, 1],
-        dirs[:, 2],
-        **kwargs,
-    )
+    Normals are drawn as line segments from `origins` to `origins + length*dirs`
+    using a single line collection, which scales much better than `ax.quiver`
+    for many normals. Arrow heads are omitted.
+    """
+    kwargs = {"linewidth": 0.5, "zorder": 2, "length": 0.1, **kwargs}
+    length = kwargs.pop("length")
+    return plot_edges(ax, origins, origins + length * dirs, **kwargs)
 
 
 def plot_edges(ax, src, dst, **kwargs):
@@ -191,6 +280,7 @@ def plot_edges(ax, src, dst, **kwargs):
     lines = np.stack((src, dst), 1)
     art = Line3DCollection(lines, **kwargs)
     ax.add_collection3d(art)
+    return art
 
 
 def create_mesh_figure(
@@ -242,7 +332,16 @@ def generate_rotation_gif(
     num_images: int = 64,
     total_time: float = 5.0,
 ):
-    """Generates a rotating figure and stores it as animated GIF.
+    """Generates a rotating figure and stores it as animated GIF or video.
+
+    The output format is determined by the filename extension. For `.mp4`
+    files, frames are encoded as H.264 video (requires `imageio-ffmpeg`),
+    which is considerably faster than GIF palette quantization. All other
+    extensions are written as animated GIF.
+
+    Artists are expected to be fully set up before calling this method. Each
+    frame only updates the camera view of the given axes, so artists (such as
+    the meshes returned by `plot_mesh`) are reused across frames.
 
     Params:
         filename: path to resulting file
@@ -260,18 +359,44 @@ def generate_rotation_gif(
     )
 
     if isinstance(axs, Axes):
-        axs = [Axes]
+        axs = [axs]
 
     azimuth0, elevation0 = zip(*[(ax.azim, ax.elev) for ax in axs])
 
-    with imageio.get_writer(
-        filename, mode="I", duration=total_time / num_images
-    ) as writer:
+    is_video = str(filename).lower().endswith(".mp4")
+    if is_video:
+        writer_kwargs = {"fps": num_images / total_time, "codec": "libx264"}
+    else:
+        writer_kwargs = {"mode": "I", "duration": total_time / num_images}
+
+    # For video, drawing and encoding are pipelined: while frame n is encoded on
+    # a worker thread, frame n+1 is drawn. At most one frame is pending at any
+    # time. The first frame is written on the main thread, because it starts the
+    # ffmpeg subprocess and forking from other threads is unsafe with some
+    # threading layers (e.g. numba's TBB). GIF frames are only buffered until
+    # the writer is closed, so they are appended directly.
+    pool_ctx = ThreadPoolExecutor(max_workers=1) if is_video else nullcontext()
+    with imageio.get_writer(filename, **writer_kwargs) as writer, pool_ctx as pool:
         canvas = FigureCanvasAgg(fig)
-        for ainc in azimuth_incs:
+        w, h = canvas.get_width_height()
+        pending = None
+        for n, ainc in enumerate(azimuth_incs):
             for ax, az0, el0 in zip(axs, azimuth0, elevation0):
                 ax.view_init(elev=el0, azim=az0 + ainc)
+            # A full synchronous draw is needed: the frame is read back from the
+            # Agg buffer right away (draw_idle/flush_events are no-ops here), and
+            # a camera change invalidates every 3d artist anyway.
             canvas.draw()
-            buf = canvas.buffer_rgba()
-            img = np.asarray(buf)
-            writer.append_data(img)
+            # Copy is required, the next draw overwrites the canvas buffer while
+            # the writer might still hold on to the frame (the GIF writer buffers
+            # all frames until it is closed).
+            img = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
+            img = img.reshape(h, w, 4).copy()
+            if pending is not None:
+                pending.result()
+            if pool is not None and n > 0:
+                pending = pool.submit(writer.append_data, img)
+            else:
+                writer.append_data(img)
+        if pending is not None:
+            pending.result()
@@ -32,5 +32,6 @@ setup(
     keywords="sdf isoextraction dual contouring",
     extras_require={
         "dev": dev_required,
+        "jit": ["numba"],
     },
 )
@@ -0,0 +1,35 @@
+import numpy as np
+import sdftoolbox
+from sdftoolbox import dual_kernels
+
+
+def test_fused_matches_generic():
+    scene = sdftoolbox.sdfs.Union(
+        [
+            sdftoolbox.sdfs.Sphere.create(center=(0, 0, 0), radius=0.5),
+            sdftoolbox.sdfs.Box((1.5, 0.3, 0.3)),
+        ]
+    )
+    grid = sdftoolbox.Grid(res=(9, 11, 10))
+    sdfv = scene.sample(grid.xyz)
+
+    for vs in [
+        sdftoolbox.NaiveSurfaceNetVertexStrategy(),
+        sdftoolbox.MidpointVertexStrategy(),
+    ]:
+        verts, faces = sdftoolbox.dual_isosurface(
+            scene, grid, vertex_strategy=vs, jit=False
+        )
+
+        fverts, fvoxels, ffaces = dual_kernels.fused_dual_isosurface(
+            sdfv, midpoint=isinstance(vs, sdftoolbox.MidpointVertexStrategy)
+        )
+        assert np.array_equal(ffaces, faces)
+        fverts = np.clip(fverts - fvoxels, -0.1, 1.1) + fvoxels
+        assert np.allclose(grid.grid_to_data(fverts), verts)
+
+        jverts, jfaces = sdftoolbox.dual_isosurface(
+            scene, grid, vertex_strategy=vs, jit=True
+        )
+        assert np.array_equal(jfaces, faces)
+        assert np.allclose(jverts, verts)
@@ -0,0 +1,15 @@
+import numpy as np
+from sdftoolbox.dual_strategies import LinearEdgeStrategy
+
+
+def test_linear_roots():
+    roots = LinearEdgeStrategy.compute_linear_roots
+    assert roots(0.5, -0.5) == 0.5
+    assert roots(np.float32(1), np.float32(-3)) == 0.25
+    assert np.allclose(roots(np.array([1, -2]), np.array([-1, 2])), [0.5, 0.5])
+
+    src = np.array([1.0, -0.25], dtype=np.float32)
+    dst = np.array([-3.0, 0.75], dtype=np.float32)
+    t = roots(src, dst)
+    assert t.dtype == np.float32
+    assert np.allclose(t, [0.25, 0.25])
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 from sdftoolbox import Grid
 from sdftoolbox.utils import reorient_volume
@@ -72,6 +73,39 @@ def test_find_edge_vertices():
     )
 
 
+def test_flat_topology_matches_nd():
+    g = Grid((5, 6, 7))
+
+    edges = np.arange(g.num_edges)
+    flat, mask = g.find_voxels_sharing_edge(edges)
+    nd, nd_mask = g.find_voxels_sharing_edge(edges, ravel=False)
+    assert_allclose(mask, nd_mask)
+    assert_allclose(flat, g.ravel_nd(nd.reshape(-1, 3), g.padded_shape).reshape(-1, 4))
+    assert_allclose(flat[~mask], 0)
+
+    voxels = g.ravel_nd(np.indices((4, 5, 6)).reshape(3, -1).T, g.padded_shape)
+    flat = g.find_voxel_edges(voxels)
+    nd = g.find_voxel_edges(voxels, ravel=False)
+    assert_allclose(flat, g.ravel_nd(nd.reshape(-1, 4), g.edge_shape).reshape(-1, 12))
+
+    # Voxels in the padding area have edges outside of the grid
+    for voxel in [(3, 3, 3), (0, 3, 0), (-1, 0, 0)]:
+        with pytest.raises(ValueError):
+            Grid((4, 4, 4)).find_voxel_edges(np.array([voxel]))
+
+
+def test_source_vertices_cached():
+    grid = Grid((3, 4, 5))
+    sijk = grid.get_all_source_vertices()
+    assert sijk is grid.get_all_source_vertices()
+    assert sijk is not Grid((3, 4, 5)).get_all_source_vertices()
+    assert not sijk.flags.writeable
+    assert_allclose(
+        grid.get_all_source_vertices(ravel=True),
+        np.ravel_multi_index(list(sijk.T), (4, 5, 6)),
+    )
+
+
 # def test_correct_voxel_indices():
 #     t = VolumeTopology((4, 4, 4))
 #     assert t.voxel_indices.shape == (3, 3, 3, 3)
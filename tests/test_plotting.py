@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import sdftoolbox
+from sdftoolbox import plotting
+
+
+def _render(indexed: bool, setup: bool = True, **kwargs):
+    scene = sdftoolbox.sdfs.Sphere.create(radius=0.5)
+    grid = sdftoolbox.Grid(res=(10, 10, 10))
+    verts, faces = sdftoolbox.dual_isosurface(scene, grid)
+    fig, ax = plotting.create_figure(headless=True)
+    canvas = FigureCanvasAgg(fig)
+    mesh = plotting.plot_mesh(ax, verts, faces, indexed=indexed, **kwargs)
+    if setup:
+        plotting.setup_axes(ax, grid.min_corner, grid.max_corner)
+    canvas.draw()
+    img = np.asarray(canvas.buffer_rgba()).copy()
+    return img, ax, mesh, verts
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"shade": True, "facecolors": "C0"}])
+def test_indexed_mesh_renders_equivalent(kwargs):
+    img, _, _, _ = _render(False, **kwargs)
+    iimg, _, imesh, _ = _render(True, **kwargs)
+    assert isinstance(imesh, plotting.IndexedPoly3DCollection)
+    assert np.array_equal(img, iimg)
+
+
+def test_indexed_mesh_limits():
+    _, ax, _, verts = _render(True, setup=False)
+    for i, lim in enumerate(["get_xlim3d", "get_ylim3d", "get_zlim3d"]):
+        lo, hi = getattr(ax, lim)()
+        assert lo <= verts[:, i].min() and verts[:, i].max() <= hi
+
+
+def test_indexed_mesh_updates_lazily():
+    _, ax, mesh, verts = _render(True)
+    version = mesh._materialized_version
+    mesh.set_indexed_verts(verts=verts * 0.5)
+    mesh.set_indexed_verts(verts=verts * 0.25)
+    assert mesh._materialized_version == version
+    ax.figure.canvas.draw()
+    assert mesh._materialized_version == mesh._version